@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import sys
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from copy import deepcopy
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from importlib.util import find_spec
 from logging import INFO
+from operator import itemgetter
 from typing import TYPE_CHECKING, Any, Callable, Literal, cast
 
 from litestar.exceptions import ImproperlyConfiguredException, MissingDependencyException
-from litestar.serialization import encode_json
 from litestar.serialization.msgspec_hooks import _msgspec_json_encoder
 from litestar.utils.deprecation import deprecated
 
@@ -17,6 +19,7 @@ __all__ = ("BaseLoggingConfig", "LoggingConfig", "StructLoggingConfig")
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from types import ModuleType
     from typing import NoReturn
 
     # these imports are duplicated on purpose so sphinx autodoc can find and link them
@@ -27,12 +30,12 @@ if TYPE_CHECKING:
     from litestar.types.callable_types import ExceptionLoggingHandler, GetLogger
 
 
-try:
-    from structlog.types import BindableLogger, Processor, WrappedLogger
-except ImportError:
-    BindableLogger = Any  # type: ignore
-    Processor = Any  # type: ignore
-    WrappedLogger = Any  # type: ignore
+if not TYPE_CHECKING:
+    # structlog is imported lazily where it is used, so importing litestar does not pull it in (and the modules it
+    # depends on). At runtime these aliases only need to exist for introspection of the annotations.
+    BindableLogger = Any
+    Processor = Any
+    WrappedLogger = Any
 
 
 default_handlers: dict[str, dict[str, Any]] = {
@@ -73,15 +76,97 @@ def get_logger_placeholder(_: str | None = None) -> NoReturn:
     )
 
 
+@lru_cache(maxsize=None)
+def _is_picologging_available() -> bool:
+    """Check whether ``picologging`` can be imported.
+
+    The lookup walks the import machinery, so its result is cached after the first call.
+
+    Returns:
+        ``True`` if ``picologging`` is installed, ``False`` otherwise.
+    """
+    return bool(find_spec("picologging"))
+
+
+def _get_default_handler_templates() -> dict[str, dict[str, Any]]:
+    """Return the module level default logging handlers matching the installed logging library.
+
+    The returned dictionary is shared and must not be modified.
+
+    Returns:
+        A dictionary of logging handlers
+    """
+    return default_picologging_handlers if _is_picologging_available() else default_handlers
+
+
 def _get_default_handlers() -> dict[str, dict[str, Any]]:
     """Return the default logging handlers for the config.
 
+    The module level defaults serve as templates only; a copy is returned so that modifying the handlers of one
+    config does not affect the defaults or other configs.
+
     Returns:
         A dictionary of logging handlers
     """
-    if find_spec("picologging"):
-        return default_picologging_handlers
-    return default_handlers
+    return deepcopy(_get_default_handler_templates())
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: type) -> tuple[str, ...]:
+    """Return the field names of a dataclass.
+
+    Args:
+        cls: A dataclass type.
+
+    Returns:
+        A tuple of field names, in definition order.
+    """
+    return tuple(f.name for f in fields(cls))
+
+
+def _uses_picologging(handlers: dict[str, dict[str, Any]]) -> bool:
+    """Check whether any of the given handlers is backed by ``picologging``.
+
+    Args:
+        handlers: A dictionary of logging handler configurations.
+
+    Returns:
+        ``True`` if a handler class or factory refers to ``picologging``, ``False`` otherwise.
+    """
+    return any(
+        "picologging" in str(handler.get("class", "")) or "picologging" in str(handler.get("()", ""))
+        for handler in handlers.values()
+        if isinstance(handler, dict)
+    )
+
+
+_get_connection_type_and_path = itemgetter("type", "path")
+
+
+@lru_cache(maxsize=2)
+def _get_logging_backend(use_picologging: bool) -> tuple[ModuleType, GetLogger]:
+    """Resolve the logging backend to configure.
+
+    The result is cached, so the backend is only imported the first time it is configured.
+
+    Args:
+        use_picologging: Whether to use ``picologging`` instead of the standard library.
+
+    Raises:
+        MissingDependencyException: If ``picologging`` is requested but not installed.
+
+    Returns:
+        A tuple of the backend's ``config`` module and its ``getLogger`` function.
+    """
+    if use_picologging:
+        try:
+            from picologging import config, getLogger
+        except ImportError as e:
+            raise MissingDependencyException("picologging") from e
+    else:
+        from logging import config, getLogger  # type: ignore[no-redef, assignment]
+
+    return config, cast("Callable[[str], Logger]", getLogger)
 
 
 def _default_exception_logging_handler_factory(
@@ -98,24 +183,26 @@ def _default_exception_logging_handler_factory(
         An exception logging handler.
     """
 
+    # we limit the length of the stack trace to 'traceback_line_limit' lines, not counting the first line; a limit of
+    # 0 (or less) logs the full traceback. Slicing from the end avoids shifting the whole (potentially very long) list
+    # to remove the first line.
+    line_limit = traceback_line_limit if traceback_line_limit > 0 else sys.maxsize
+
+    def _struct_exception_logging_handler(logger: Logger, scope: Scope, tb: list[str]) -> None:
+        connection_type, path = _get_connection_type_and_path(scope)
+        logger.exception(
+            "Uncaught Exception",
+            connection_type=connection_type,
+            path=path,
+            traceback="".join(tb[max(len(tb) - line_limit, 1) :]),
+        )
+
     def _default_exception_logging_handler(logger: Logger, scope: Scope, tb: list[str]) -> None:
-        # we limit the length of the stack trace to 20 lines.
-        first_line = tb.pop(0)
-
-        if is_struct_logger:
-            logger.exception(
-                "Uncaught Exception",
-                connection_type=scope["type"],
-                path=scope["path"],
-                traceback="".join(tb[-traceback_line_limit:]),
-            )
-        else:
-            stack_trace = first_line + "".join(tb[-traceback_line_limit:])
-            logger.exception(
-                "exception raised on %s connection to route %s\n\n%s", scope["type"], scope["path"], stack_trace
-            )
+        connection_type, path = _get_connection_type_and_path(scope)
+        stack_trace = tb[0] + "".join(tb[max(len(tb) - line_limit, 1) :])
+        logger.exception("exception raised on %s connection to route %s\n\n%s", connection_type, path, stack_trace)
 
-    return _default_exception_logging_handler
+    return _struct_exception_logging_handler if is_struct_logger else _default_exception_logging_handler
 
 
 class BaseLoggingConfig(ABC):
@@ -207,7 +294,7 @@ class LoggingConfig(BaseLoggingConfig):
 
     def __post_init__(self) -> None:
         if "queue_listener" not in self.handlers:
-            self.handlers["queue_listener"] = _get_default_handlers()["queue_listener"]
+            self.handlers["queue_listener"] = deepcopy(_get_default_handler_templates()["queue_listener"])
 
         if "litestar" not in self.loggers:
             self.loggers["litestar"] = {
@@ -228,25 +315,25 @@ class LoggingConfig(BaseLoggingConfig):
             A 'logging.getLogger' like function.
         """
 
-        if "picologging" in str(encode_json(self.handlers)):
-            try:
-                from picologging import config, getLogger
-            except ImportError as e:
-                raise MissingDependencyException("picologging") from e
+        values: dict[str, Any] = {
+            "version": self.version,
+            "disable_existing_loggers": self.disable_existing_loggers,
+            "formatters": self.formatters,
+            "handlers": self.handlers,
+            "loggers": self.loggers,
+        }
+        if self.filters is not None:
+            values["filters"] = self.filters
+        if self.configure_root_logger:
+            values["root"] = self.root
 
-            values = {
-                k: v
-                for k, v in asdict(self).items()
-                if v is not None and k not in ("incremental", "configure_root_logger")
-            }
-        else:
-            from logging import config, getLogger  # type: ignore[no-redef, assignment]
+        use_picologging = _uses_picologging(self.handlers)
+        if not use_picologging:
+            values["incremental"] = self.incremental
 
-            values = {k: v for k, v in asdict(self).items() if v is not None and k not in ("configure_root_logger",)}
-        if not self.configure_root_logger:
-            values.pop("root")
+        config, get_logger = _get_logging_backend(use_picologging)
         config.dictConfig(values)
-        return cast("Callable[[str], Logger]", getLogger)
+        return get_logger
 
     @staticmethod
     def set_level(logger: Logger, level: int) -> None:
@@ -279,7 +366,7 @@ class StructlogEventFilter:
         Args:
             filter_keys: Iterable of string keys to be excluded from the log event.
         """
-        self.filter_keys = filter_keys
+        self.filter_keys = frozenset(filter_keys)
 
     def __call__(self, _: WrappedLogger, __: str, event_dict: EventDict) -> EventDict:
         """Receive the log event, and filter keys.
@@ -292,70 +379,87 @@ class StructlogEventFilter:
         Returns:
             The log event with any key in `self.filter_keys` removed.
         """
-        for key in self.filter_keys:
-            event_dict.pop(key, None)
+        if len(self.filter_keys) <= 4:
+            pop = event_dict.pop
+            for key in self.filter_keys:
+                pop(key, None)
+        else:
+            # only visit the keys that are actually present in the event
+            for key in self.filter_keys & event_dict.keys():
+                del event_dict[key]
         return event_dict
 
 
+# bound once, as the serializers run for every log event
+_encode_json = _msgspec_json_encoder.encode
+
+
 def default_json_serializer(value: EventDict, **_: Any) -> bytes:
-    return _msgspec_json_encoder.encode(value)
+    return _encode_json(value)
 
 
 def stdlib_json_serializer(value: EventDict, **_: Any) -> str:  # pragma: no cover
-    return _msgspec_json_encoder.encode(value).decode("utf-8")
-
+    return _encode_json(value).decode()
 
-def default_structlog_processors(as_json: bool = True) -> list[Processor]:  # pyright: ignore
-    """Set the default processors for structlog.
 
-    Returns:
-        An optional list of processors.
-    """
+@lru_cache(maxsize=2)
+def _default_structlog_processors(as_json: bool) -> tuple[Processor, ...]:  # pyright: ignore
     try:
         import structlog
-        from structlog.dev import RichTracebackFormatter
 
         if as_json:
-            return [
+            return (
                 structlog.contextvars.merge_contextvars,
                 structlog.processors.add_log_level,
                 structlog.processors.format_exc_info,
                 structlog.processors.TimeStamper(fmt="iso"),
                 structlog.processors.JSONRenderer(serializer=default_json_serializer),
-            ]
-        return [
+            )
+
+        from structlog.dev import RichTracebackFormatter
+
+        return (
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.dev.ConsoleRenderer(
                 colors=True, exception_formatter=RichTracebackFormatter(max_frames=1, show_locals=False, width=80)
             ),
-        ]
+        )
 
     except ImportError:
-        return []
+        return ()
 
 
-def default_structlog_standard_lib_processors(as_json: bool = True) -> list[Processor]:  # pyright: ignore
-    """Set the default processors for structlog stdlib.
+def default_structlog_processors(as_json: bool = True) -> list[Processor]:  # pyright: ignore
+    """Set the default processors for structlog.
+
+    The processors are stateless and only built once per ``as_json`` value; a new list is returned on every call.
 
     Returns:
         An optional list of processors.
     """
+    return list(_default_structlog_processors(as_json))
+
+
+@lru_cache(maxsize=2)
+def _default_structlog_standard_lib_processors(as_json: bool) -> tuple[Processor, ...]:  # pyright: ignore
     try:
         import structlog
-        from structlog.dev import RichTracebackFormatter
 
         if as_json:
-            return [
+            return (
                 structlog.processors.TimeStamper(fmt="iso"),
                 structlog.stdlib.add_log_level,
                 structlog.stdlib.ExtraAdder(),
                 StructlogEventFilter(["color_message"]),
                 structlog.stdlib.ProcessorFormatter.remove_processors_meta,
                 structlog.processors.JSONRenderer(serializer=stdlib_json_serializer),
-            ]
-        return [
+            )
+
+        from structlog.dev import RichTracebackFormatter
+
+        return (
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.stdlib.add_log_level,
             structlog.stdlib.ExtraAdder(),
@@ -364,14 +468,28 @@ def default_structlog_standard_lib_processors(as_json: bool = True) -> list[Proc
             structlog.dev.ConsoleRenderer(
                 colors=True, exception_formatter=RichTracebackFormatter(max_frames=1, show_locals=False, width=80)
             ),
-        ]
+        )
     except ImportError:
-        return []
+        return ()
 
 
+def default_structlog_standard_lib_processors(as_json: bool = True) -> list[Processor]:  # pyright: ignore
+    """Set the default processors for structlog stdlib.
+
+    The processors are stateless and only built once per ``as_json`` value; a new list is returned on every call.
+
+    Returns:
+        An optional list of processors.
+    """
+    return list(_default_structlog_standard_lib_processors(as_json))
+
+
+@lru_cache(maxsize=2)
 def default_logger_factory(as_json: bool = True) -> Callable[..., WrappedLogger] | None:
     """Set the default logger factory for structlog.
 
+    The factory is only created once per ``as_json`` value.
+
     Returns:
         An optional logger factory.
     """
@@ -385,6 +503,45 @@ def default_logger_factory(as_json: bool = True) -> Callable[..., WrappedLogger]
         return None
 
 
+def _default_structlog_standard_lib_logging_config(as_json: bool) -> LoggingConfig:
+    """Return the standard logging configuration used by :class:`StructLoggingConfig` by default.
+
+    The configuration routes standard library records through ``structlog``'s formatter. A new configuration is
+    returned on every call, only the (stateless) processors are shared.
+
+    Raises:
+        ImportError: If ``structlog`` is not installed.
+
+    Args:
+        as_json: Whether the records should be rendered as JSON.
+
+    Returns:
+        A :class:`LoggingConfig` using a ``structlog`` formatter.
+    """
+    import structlog
+
+    return LoggingConfig(
+        formatters={
+            "standard": {
+                "()": structlog.stdlib.ProcessorFormatter,
+                "processors": default_structlog_standard_lib_processors(as_json=as_json),
+            }
+        }
+    )
+
+
+# fields of StructLoggingConfig that are not passed on to 'structlog.configure'
+_STRUCTLOG_CONFIGURE_EXCLUDED_FIELDS = frozenset(
+    {
+        "standard_lib_logging_config",
+        "log_exceptions",
+        "traceback_line_limit",
+        "exception_logging_handler",
+        "pretty_print_tty",
+    }
+)
+
+
 @dataclass
 class StructLoggingConfig(BaseLoggingConfig):
     """Configuration class for structlog.
@@ -418,28 +575,18 @@ class StructLoggingConfig(BaseLoggingConfig):
     """Pretty print log output when run from an interactive terminal."""
 
     def __post_init__(self) -> None:
+        as_json = not sys.stderr.isatty() and self.pretty_print_tty
         if self.processors is None:
-            self.processors = default_structlog_processors(not sys.stderr.isatty() and self.pretty_print_tty)
+            self.processors = default_structlog_processors(as_json)
         if self.logger_factory is None:
-            self.logger_factory = default_logger_factory(not sys.stderr.isatty() and self.pretty_print_tty)
+            self.logger_factory = default_logger_factory(as_json)
         if self.log_exceptions != "never" and self.exception_logging_handler is None:
             self.exception_logging_handler = _default_exception_logging_handler_factory(
                 is_struct_logger=True, traceback_line_limit=self.traceback_line_limit
             )
         try:
-            import structlog
-
             if self.standard_lib_logging_config is None:
-                self.standard_lib_logging_config = LoggingConfig(
-                    formatters={
-                        "standard": {
-                            "()": structlog.stdlib.ProcessorFormatter,
-                            "processors": default_structlog_standard_lib_processors(
-                                as_json=not sys.stderr.isatty() and self.pretty_print_tty
-                            ),
-                        }
-                    }
-                )
+                self.standard_lib_logging_config = _default_structlog_standard_lib_logging_config(as_json)
         except ImportError:
             self.standard_lib_logging_config = LoggingConfig()
 
@@ -456,16 +603,9 @@ class StructLoggingConfig(BaseLoggingConfig):
 
         structlog.configure(
             **{
-                k: v
-                for k, v in asdict(self).items()
-                if k
-                not in (
-                    "standard_lib_logging_config",
-                    "log_exceptions",
-                    "traceback_line_limit",
-                    "exception_logging_handler",
-                    "pretty_print_tty",
-                )
+                name: getattr(self, name)
+                for name in _get_field_names(type(self))
+                if name not in _STRUCTLOG_CONFIGURE_EXCLUDED_FIELDS
             }
         )
         return structlog.get_logger
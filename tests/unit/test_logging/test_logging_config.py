@@ -1,13 +1,23 @@
 import logging
+import logging.config
 import sys
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Generator, List
 from unittest.mock import Mock, patch
 
 import pytest
 
 from litestar import Request, get
-from litestar.exceptions import ImproperlyConfiguredException
-from litestar.logging.config import LoggingConfig, _get_default_handlers, default_handlers, default_picologging_handlers
+from litestar.exceptions import ImproperlyConfiguredException, MissingDependencyException
+from litestar.logging.config import (
+    LoggingConfig,
+    _default_exception_logging_handler_factory,
+    _get_default_handlers,
+    _get_logging_backend,
+    _is_picologging_available,
+    _uses_picologging,
+    default_handlers,
+    default_picologging_handlers,
+)
 from litestar.logging.picologging import QueueListenerHandler as PicologgingQueueListenerHandler
 from litestar.logging.standard import QueueListenerHandler as StandardQueueListenerHandler
 from litestar.status_codes import HTTP_200_OK
@@ -17,6 +27,22 @@ if TYPE_CHECKING:
     from _pytest.logging import LogCaptureFixture
 
 
+@pytest.fixture(autouse=True)
+def clear_picologging_detection_cache() -> Generator[None, None, None]:
+    # the cached result must not leak from tests that patch 'find_spec'
+    _is_picologging_available.cache_clear()
+    yield
+    _is_picologging_available.cache_clear()
+
+
+@pytest.fixture()
+def clear_logging_backend_cache() -> Generator[None, None, None]:
+    # a backend resolved while imports are patched must not leak into other tests
+    _get_logging_backend.cache_clear()
+    yield
+    _get_logging_backend.cache_clear()
+
+
 @pytest.mark.parametrize(
     "dict_config_class, handlers, expected_called",
     [
@@ -38,6 +64,63 @@ def test_correct_dict_config_called(
             assert not dict_config_mock.called
 
 
+@pytest.mark.parametrize("configure_root_logger", [True, False])
+def test_dict_config_values(configure_root_logger: bool) -> None:
+    filters = {"my_filter": {"name": "litestar"}}
+    with patch("logging.config.dictConfig") as dict_config_mock:
+        log_config = LoggingConfig(
+            handlers=default_handlers, filters=filters, configure_root_logger=configure_root_logger
+        )
+        log_config.configure()
+
+    expected = {
+        "version": 1,
+        "incremental": False,
+        "disable_existing_loggers": False,
+        "filters": filters,
+        "formatters": log_config.formatters,
+        "handlers": log_config.handlers,
+        "loggers": log_config.loggers,
+    }
+    if configure_root_logger:
+        expected["root"] = log_config.root
+    dict_config_mock.assert_called_once_with(expected)
+
+
+@patch("picologging.config.dictConfig")
+def test_picologging_dict_config_values(dict_config_mock: Mock) -> None:
+    LoggingConfig(handlers=default_picologging_handlers).configure()
+    values = dict_config_mock.call_args.args[0]
+    assert "incremental" not in values
+    assert "filters" not in values
+
+
+def test_logging_backend_is_cached() -> None:
+    assert _get_logging_backend(False) is _get_logging_backend(False)
+    assert _get_logging_backend(False)[0] is logging.config
+
+
+@pytest.mark.usefixtures("clear_logging_backend_cache")
+def test_picologging_backend_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "picologging", None)
+    with pytest.raises(MissingDependencyException):
+        LoggingConfig(handlers=default_picologging_handlers).configure()
+
+
+@pytest.mark.parametrize(
+    "handlers, expected",
+    [
+        [default_handlers, False],
+        [default_picologging_handlers, True],
+        [{"queue_listener": {"class": "litestar.logging.picologging.QueueListenerHandler"}}, True],
+        [{"custom": {"()": "picologging.StreamHandler"}}, True],
+        [{"custom": {"()": "my_app.logging.make_handler", "level": "DEBUG"}}, False],
+    ],
+)
+def test_uses_picologging(handlers: Dict[str, Dict[str, Any]], expected: bool) -> None:
+    assert _uses_picologging(handlers) is expected
+
+
 @pytest.mark.parametrize("picologging_exists", [True, False])
 def test_correct_default_handlers_set(picologging_exists: bool) -> None:
     with patch("litestar.logging.config.find_spec") as find_spec_mock:
@@ -50,6 +133,70 @@ def test_correct_default_handlers_set(picologging_exists: bool) -> None:
             assert log_config.handlers == default_handlers
 
 
+def test_default_handlers_are_copied() -> None:
+    log_config = LoggingConfig()
+    log_config.handlers["queue_listener"]["level"] = "ERROR"
+    log_config.handlers.pop("console")
+
+    assert default_handlers["queue_listener"]["level"] == "DEBUG"
+    assert default_picologging_handlers["queue_listener"]["level"] == "DEBUG"
+    assert "console" in LoggingConfig().handlers
+
+
+@pytest.mark.parametrize(
+    "traceback_line_limit, expected_lines",
+    [
+        [2, ["line 998\n", "line 999\n"]],
+        [0, [f"line {i}\n" for i in range(1, 1000)]],
+        [2000, [f"line {i}\n" for i in range(1, 1000)]],
+    ],
+)
+def test_default_exception_logging_handler_traceback_limit(
+    traceback_line_limit: int, expected_lines: List[str]
+) -> None:
+    tb = ["Traceback (most recent call last):\n"] + [f"line {i}\n" for i in range(1, 1000)]
+    logger = Mock()
+    exception_logging_handler = _default_exception_logging_handler_factory(
+        is_struct_logger=False, traceback_line_limit=traceback_line_limit
+    )
+    exception_logging_handler(logger, {"type": "http", "path": "/"}, tb)  # type: ignore[arg-type]
+
+    logger.exception.assert_called_once_with(
+        "exception raised on %s connection to route %s\n\n%s",
+        "http",
+        "/",
+        "Traceback (most recent call last):\n" + "".join(expected_lines),
+    )
+
+
+def test_struct_exception_logging_handler() -> None:
+    tb = ["Traceback (most recent call last):\n", "line 1\n", "line 2\n", "ValueError: error\n"]
+    logger = Mock()
+    exception_logging_handler = _default_exception_logging_handler_factory(
+        is_struct_logger=True, traceback_line_limit=2
+    )
+    exception_logging_handler(logger, {"type": "http", "path": "/"}, tb)  # type: ignore[arg-type]
+
+    logger.exception.assert_called_once_with(
+        "Uncaught Exception", connection_type="http", path="/", traceback="line 2\nValueError: error\n"
+    )
+
+
+def test_default_queue_listener_handler_is_copied() -> None:
+    log_config = LoggingConfig(handlers={"console": {"class": "logging.StreamHandler"}})
+    log_config.handlers["queue_listener"]["level"] = "ERROR"
+
+    assert default_handlers["queue_listener"]["level"] == "DEBUG"
+    assert default_picologging_handlers["queue_listener"]["level"] == "DEBUG"
+
+
+def test_picologging_detection_is_cached() -> None:
+    with patch("litestar.logging.config.find_spec") as find_spec_mock:
+        LoggingConfig()
+        LoggingConfig()
+        assert find_spec_mock.call_count == 1
+
+
 @pytest.mark.parametrize(
     "dict_config_class, handlers",
     [
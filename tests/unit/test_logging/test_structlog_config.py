@@ -1,6 +1,7 @@
 import datetime
+import subprocess
 import sys
-from typing import Callable
+from typing import Callable, Iterable
 
 import pytest
 import structlog
@@ -9,7 +10,15 @@ from structlog import BytesLoggerFactory, get_logger
 from structlog.processors import JSONRenderer
 from structlog.types import BindableLogger, WrappedLogger
 
-from litestar.logging.config import LoggingConfig, StructlogEventFilter, StructLoggingConfig, default_json_serializer
+from litestar.logging.config import (
+    LoggingConfig,
+    StructlogEventFilter,
+    StructLoggingConfig,
+    default_json_serializer,
+    default_logger_factory,
+    default_structlog_processors,
+    default_structlog_standard_lib_processors,
+)
 from litestar.plugins.structlog import StructlogConfig, StructlogPlugin
 from litestar.serialization import decode_json
 from litestar.testing import create_test_client
@@ -26,6 +35,67 @@ def test_event_filter() -> None:
     assert log_event == {"b_key": "b_val"}
 
 
+@pytest.mark.parametrize("filter_keys", [["a", "b"], ["a", "b", "x", "y", "z"], (key for key in ("a", "b"))])
+def test_event_filter_keys(filter_keys: Iterable[str]) -> None:
+    event_filter = StructlogEventFilter(filter_keys)
+    for _ in range(2):
+        log_event = event_filter(..., "", {"a": 1, "b": 2, "c": 3})
+        assert log_event == {"c": 3}
+
+
+@pytest.mark.parametrize("as_json", [True, False])
+@pytest.mark.parametrize("factory", [default_structlog_processors, default_structlog_standard_lib_processors])
+def test_default_processors_are_reused(factory: Callable[[bool], list], as_json: bool) -> None:
+    first = factory(as_json)
+    second = factory(as_json)
+    assert first is not second
+    assert first == second
+    assert all(a is b for a, b in zip(first, second))
+
+
+def test_default_logger_factory_is_reused() -> None:
+    assert default_logger_factory(True) is default_logger_factory(True)
+    assert default_logger_factory(False) is default_logger_factory(False)
+    assert default_logger_factory(True) is not default_logger_factory(False)
+
+
+def test_structlog_not_imported_with_logging_config() -> None:
+    code = "import sys, litestar.logging.config; assert 'structlog' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_default_standard_lib_logging_config_is_not_shared() -> None:
+    first = StructLoggingConfig().standard_lib_logging_config
+    second = StructLoggingConfig().standard_lib_logging_config
+    assert first is not None
+    assert second is not None
+    assert first is not second
+
+    first.loggers["myapp"] = {"level": "INFO", "handlers": ["queue_listener"]}
+    first.handlers["queue_listener"]["level"] = "ERROR"
+    assert "myapp" not in second.loggers
+    assert second.handlers["queue_listener"]["level"] == "DEBUG"
+
+    first_processors = first.formatters["standard"]["processors"]
+    second_processors = second.formatters["standard"]["processors"]
+    assert first_processors is not second_processors
+    assert all(a is b for a, b in zip(first_processors, second_processors))
+
+
+def test_standard_lib_logging_config_fallback_without_structlog_is_not_shared(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "structlog", None)
+    first = StructLoggingConfig(processors=[], logger_factory=BytesLoggerFactory())
+    second = StructLoggingConfig(processors=[], logger_factory=BytesLoggerFactory())
+    assert isinstance(first.standard_lib_logging_config, LoggingConfig)
+    assert isinstance(second.standard_lib_logging_config, LoggingConfig)
+    assert first.standard_lib_logging_config is not second.standard_lib_logging_config
+
+    first.standard_lib_logging_config.loggers["myapp"] = {"level": "INFO", "handlers": ["queue_listener"]}
+    first.standard_lib_logging_config.handlers["queue_listener"]["level"] = "ERROR"
+    assert "myapp" not in second.standard_lib_logging_config.loggers
+    assert second.standard_lib_logging_config.handlers["queue_listener"]["level"] == "DEBUG"
+
+
 def test_set_level_custom_logger_factory() -> None:
     """Functionality test for the event filter processor."""
 